@@ -6,13 +6,14 @@ It's particularly useful when you have objects with many optional parameters
 or when you want to create different representations of the same product.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 
 class Meal:
     """The product class - represents a complete meal"""
     
+    __slots__ = ("main_course", "side", "drink")
+    
     def __init__(self):
         self.main_course: Optional[str] = None
         self.side: Optional[str] = None
@@ -22,73 +23,77 @@ class Meal:
         return f"Meal: {self.main_course} + {self.side} + {self.drink}"
 
 
-class MealBuilder(ABC):
-    """Abstract builder interface"""
+class MealPool:
+    """Recycles released Meal instances instead of allocating new ones"""
+    
+    __slots__ = ("_pool",)
     
     def __init__(self):
-        self.meal = Meal()
+        self._pool: List[Meal] = []
+    
+    def acquire(self) -> Meal:
+        """Return a recycled meal if one is available, otherwise a new one"""
+        return self._pool.pop() if self._pool else Meal()
+    
+    def release(self, meal: Meal) -> None:
+        """Reset a meal that is no longer used and return it to the pool"""
+        meal.main_course = meal.side = meal.drink = None
+        self._pool.append(meal)
+
+
+meal_pool = MealPool()
+
+
+class MealBuilder:
+    """Base builder interface"""
+    
+    __slots__ = ("meal",)
+    
+    def __init__(self):
+        self.meal = meal_pool.acquire()
     
-    @abstractmethod
     def set_main_course(self) -> 'MealBuilder':
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_side(self) -> 'MealBuilder':
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_drink(self) -> 'MealBuilder':
-        pass
+        raise NotImplementedError
     
     def build(self) -> Meal:
         return self.meal
 
 
-class BurgerMealBuilder(MealBuilder):
-    """Concrete builder for burger meals"""
-    
-    def set_main_course(self) -> 'MealBuilder':
-        self.meal.main_course = "Cheeseburger"
-        return self
-    
-    def set_side(self) -> 'MealBuilder':
-        self.meal.side = "French Fries"
-        return self
-    
-    def set_drink(self) -> 'MealBuilder':
-        self.meal.drink = "Cola"
-        return self
+# Main course, side and drink for each meal type
+MEAL_SPECS = {
+    "burger": ("Cheeseburger", "French Fries", "Cola"),
+    "pizza": ("Margherita Pizza", "Garlic Bread", "Orange Juice"),
+    "salad": ("Caesar Salad", "Soup", "Green Tea"),
+}
 
 
-class PizzaMealBuilder(MealBuilder):
-    """Concrete builder for pizza meals"""
+class ConcreteMealBuilder(MealBuilder):
+    """Concrete builder that assembles a meal from MEAL_SPECS"""
     
-    def set_main_course(self) -> 'MealBuilder':
-        self.meal.main_course = "Margherita Pizza"
-        return self
+    __slots__ = ("spec",)
     
-    def set_side(self) -> 'MealBuilder':
-        self.meal.side = "Garlic Bread"
-        return self
-    
-    def set_drink(self) -> 'MealBuilder':
-        self.meal.drink = "Orange Juice"
-        return self
-
-
-class SaladMealBuilder(MealBuilder):
-    """Concrete builder for healthy salad meals"""
+    def __init__(self, spec_name: str):
+        if spec_name not in MEAL_SPECS:
+            raise ValueError(f"Unknown meal type: {spec_name}")
+        super().__init__()
+        self.spec = MEAL_SPECS[spec_name]
     
     def set_main_course(self) -> 'MealBuilder':
-        self.meal.main_course = "Caesar Salad"
+        self.meal.main_course = self.spec[0]
         return self
     
     def set_side(self) -> 'MealBuilder':
-        self.meal.side = "Soup"
+        self.meal.side = self.spec[1]
         return self
     
     def set_drink(self) -> 'MealBuilder':
-        self.meal.drink = "Green Tea"
+        self.meal.drink = self.spec[2]
         return self
 
 
@@ -116,28 +121,28 @@ def main():
     
     # 1. Burger Meal
     print("1. Creating Burger Meal:")
-    burger_builder = BurgerMealBuilder()
+    burger_builder = ConcreteMealBuilder("burger")
     burger_director = MealDirector(burger_builder)
     burger_meal = burger_director.construct_meal()
     print(f"   {burger_meal}\n")
     
     # 2. Pizza Meal
     print("2. Creating Pizza Meal:")
-    pizza_builder = PizzaMealBuilder()
+    pizza_builder = ConcreteMealBuilder("pizza")
     pizza_director = MealDirector(pizza_builder)
     pizza_meal = pizza_director.construct_meal()
     print(f"   {pizza_meal}\n")
     
     # 3. Salad Meal
     print("3. Creating Salad Meal:")
-    salad_builder = SaladMealBuilder()
+    salad_builder = ConcreteMealBuilder("salad")
     salad_director = MealDirector(salad_builder)
     salad_meal = salad_director.construct_meal()
     print(f"   {salad_meal}\n")
     
     # 4. Direct builder usage (without director)
     print("4. Direct Builder Usage:")
-    custom_builder = BurgerMealBuilder()
+    custom_builder = ConcreteMealBuilder("burger")
     custom_meal = (custom_builder
                    .set_main_course()
                    .set_side()
@@ -145,11 +150,17 @@ def main():
                    .build())
     print(f"   {custom_meal}\n")
     
+    # 5. Recycling meals through the pool
+    print("5. Recycling Meals Through the Pool:")
+    meal_pool.release(custom_meal)
+    recycled_meal = MealDirector(ConcreteMealBuilder("salad")).construct_meal()
+    print(f"   {recycled_meal} (reused: {recycled_meal is custom_meal})\n")
+    
     print("=== Builder Pattern Benefits ===")
     print("✓ Step-by-step object construction")
     print("✓ Different representations using same construction process")
     print("✓ Fluent interface for readable code")
-    print("✓ Easy to add new meal types")
+    print("✓ Easy to add new meal types (just add an entry to MEAL_SPECS)")
     print("✓ Separation of construction logic from representation")
 
 
@@ -3,58 +3,90 @@ Configuration settings for the FastAPI application
 """
 
 import os
-from typing import List
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from functools import lru_cache
+from typing import Any, Dict
 
+import msgspec
+from dotenv import dotenv_values
+
+
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+class Settings(msgspec.Struct, frozen=True):
+    """Application configuration loaded from environment variables."""
 
-class Settings(BaseSettings):
-    """Application configuration using Pydantic Settings."""
-    
     # Server
-    app_debug: bool = Field(default=False, env="APP_DEBUG", description="Debug mode")
-    app_host: str = Field(default="0.0.0.0", env="APP_HOST", description="Application host")
-    app_port: int = Field(default=5000, env="APP_PORT", description="Application port")
-    
+    app_debug: bool = False
+    app_host: str = "0.0.0.0"
+    app_port: int = 5000
+
     # Security
-    secret_key: str = Field(default="dev-secret-key", env="SECRET_KEY", description="Application secret key")
-    jwt_secret_key: str = Field(default="jwt-secret-key", env="JWT_SECRET_KEY", description="JWT secret key")
-    bcrypt_log_rounds: int = Field(default=12, env="BCRYPT_LOG_ROUNDS", description="BCrypt log rounds")
-    
+    secret_key: str = "dev-secret-key"
+    jwt_secret_key: str = "jwt-secret-key"
+    bcrypt_log_rounds: int = 12
+
     # MongoDB
-    mongodb_uri: str = Field(
-        default="mongodb://localhost:27017/userdb", 
-        env="MONGODB_URI", 
-        description="MongoDB connection URI"
-    )
-    mongodb_max_pool_size: int = Field(default=50, env="MONGODB_MAX_POOL_SIZE", description="MongoDB max pool size")
-    mongodb_min_pool_size: int = Field(default=10, env="MONGODB_MIN_POOL_SIZE", description="MongoDB min pool size")
-    mongodb_max_idle_time_ms: int = Field(default=30000, env="MONGODB_MAX_IDLE_TIME_MS", description="MongoDB max idle time")
-    
+    mongodb_uri: str = "mongodb://localhost:27017/userdb"
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 20
+    mongodb_max_idle_time_ms: int = 30000
+    # Needs a role with the bypassDocumentValidation action (e.g. dbAdmin);
+    # the readWrite appuser from scripts/init-mongo.js does not have it
+    mongodb_bypass_document_validation: bool = False
+
     # Logging
-    log_level: str = Field(default="INFO", env="LOG_LEVEL", description="Logging level")
-    log_file: str = Field(default="app.log", env="LOG_FILE", description="Log file path")
-    
+    log_level: str = "INFO"
+    log_file: str = "app.log"
+
     # Pagination
-    default_page_size: int = Field(default=10, env="DEFAULT_PAGE_SIZE", description="Default page size")
-    max_page_size: int = Field(default=100, env="MAX_PAGE_SIZE", description="Maximum page size")
-    
+    default_page_size: int = 10
+    max_page_size: int = 100
+
     # MongoDB Express (for compatibility)
-    mongo_express_username: str = Field(default="admin", env="MONGO_EXPRESS_USERNAME", description="Mongo Express username")
-    mongo_express_password: str = Field(default="express_password_123", env="MONGO_EXPRESS_PASSWORD", description="Mongo Express password")
-    
+    mongo_express_username: str = "admin"
+    mongo_express_password: str = "express_password_123"
+
     # MongoDB Root (for compatibility)
-    mongo_root_username: str = Field(default="admin", env="MONGO_ROOT_USERNAME", description="MongoDB root username")
-    mongo_root_password: str = Field(default="secure_password_123", env="MONGO_ROOT_PASSWORD", description="MongoDB root password")
-    mongo_database: str = Field(default="userdb", env="MONGO_DATABASE", description="MongoDB database name")
-    
+    mongo_root_username: str = "admin"
+    mongo_root_password: str = "secure_password_123"
+    mongo_database: str = "userdb"
+
     # CORS (for compatibility)
-    cors_origins: str = Field(default="*", env="CORS_ORIGINS", description="CORS origins")
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    cors_origins: str = "*"
+
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """Build settings from the .env file overlaid with os.environ."""
+        fields = {name: cls.__annotations__[name] for name in cls.__struct_fields__}
+
+        raw: Dict[str, Any] = {}
+        sources = (dotenv_values(env_file) if os.path.exists(env_file) else {}, os.environ)
+        for source in sources:
+            for key, value in source.items():
+                name = key.lower()
+                if name in fields and value is not None:
+                    raw[name] = value
+
+        for name, field_type in fields.items():
+            if field_type is bool and name in raw:
+                raw[name] = _parse_bool(name, raw[name])
+
+        return msgspec.convert(raw, cls, strict=False)
+
+
+def _parse_bool(name: str, value: str) -> bool:
+    """Parse a boolean environment value such as "true" or "True"."""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value for {name.upper()}: {value!r}")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached settings instance."""
+    return Settings.from_env()
@@ -4,8 +4,10 @@ Database connections and utilities for FastAPI
 
 import asyncio
 from typing import Optional
+import bson
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from .config import settings
+from .config import get_settings
 
 
 class Database:
@@ -17,22 +19,31 @@ class Database:
     
     async def connect(self):
         """Connect to MongoDB."""
+        if not bson.has_c():
+            print("Warning: BSON C extension is not available, falling back to pure-Python BSON")
+        
+        settings = get_settings()
         try:
             self.client = AsyncIOMotorClient(
                 settings.mongodb_uri,
                 maxPoolSize=settings.mongodb_max_pool_size,
                 minPoolSize=settings.mongodb_min_pool_size,
-                maxIdleTimeMS=settings.mongodb_max_idle_time_ms
+                maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+                compressors="zstd,zlib",
+                zlibCompressionLevel=-1,
+                retryWrites=True,
+                serverSelectionTimeoutMS=5000
             )
             self.db = self.client.get_database()
             
-            # Test connection
-            await self.client.admin.command('ping')
+            # Test connection and create indexes concurrently; index
+            # failures are logged by _create_indexes, so only ping raises
+            await asyncio.gather(
+                self.client.admin.command('ping'),
+                self._create_indexes()
+            )
             print("Connected to MongoDB")
             
-            # Create indexes
-            await self._create_indexes()
-            
         except Exception as e:
             print(f"Failed to connect to MongoDB: {e}")
             raise
@@ -47,14 +58,23 @@ class Database:
         """Create database indexes."""
         try:
             # Users collection indexes
-            await self.db.users.create_index("email", unique=True)
-            await self.db.users.create_index("created_at", -1)
-            await self.db.users.create_index([("status", 1), ("created_at", -1)])
+            user_indexes = [
+                IndexModel([("email", ASCENDING)], unique=True),
+                IndexModel([("created_at", DESCENDING)]),
+                IndexModel([("status", ASCENDING), ("created_at", DESCENDING)])
+            ]
             
             # Sessions collection indexes
-            await self.db.sessions.create_index("session_id", unique=True)
-            await self.db.sessions.create_index("user_id", 1)
-            await self.db.sessions.create_index("expires_at", 1)
+            session_indexes = [
+                IndexModel([("session_id", ASCENDING)], unique=True),
+                IndexModel([("user_id", ASCENDING)]),
+                IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            ]
+            
+            await asyncio.gather(
+                self.db.users.create_indexes(user_indexes),
+                self.db.sessions.create_indexes(session_indexes)
+            )
             
             print("Database indexes created")
         except Exception as e:
@@ -6,10 +6,9 @@ import signal
 import sys
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import ORJSONResponse
 
-from .config import settings
+from .config import get_settings
 from .database import connect_database, disconnect_database
 from .routers import user_router, system_router
 
@@ -43,6 +42,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
     
@@ -73,7 +73,10 @@ def main():
     signal.signal(signal.SIGTERM, handle_sigterm)
     signal.signal(signal.SIGINT, handle_sigterm)
     
-    # Run application with uvicorn
+    # Run application with uvicorn; imported here so importing the app stays light
+    import uvicorn
+    
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.app_host,
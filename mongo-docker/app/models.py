@@ -2,9 +2,15 @@
 Pydantic models for the FastAPI application
 """
 
-from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from datetime import datetime, timezone
+from typing import Annotated, Optional, List, Literal
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, ConfigDict
+
+
+StatusT = Literal["active", "inactive", "suspended"]
+
+# Accepts a Mongo ObjectId (or string) and stores it as a string
+PyObjectId = Annotated[str, BeforeValidator(str)]
 
 
 class UserBase(BaseModel):
@@ -12,7 +18,7 @@ class UserBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="User's full name")
     email: EmailStr = Field(..., description="User's email address")
     age: Optional[int] = Field(None, ge=0, le=150, description="User's age")
-    status: str = Field(default="active", pattern="^(active|inactive|suspended)$", description="User's status")
+    status: StatusT = Field(default="active", description="User's status")
 
 
 class UserCreate(UserBase):
@@ -25,21 +31,16 @@ class UserUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100, description="User's full name")
     email: Optional[EmailStr] = Field(None, description="User's email address")
     age: Optional[int] = Field(None, ge=0, le=150, description="User's age")
-    status: Optional[str] = Field(None, pattern="^(active|inactive|suspended)$", description="User's status")
+    status: Optional[StatusT] = Field(None, description="User's status")
 
 
 class User(UserBase):
     """Complete user model with database fields."""
-    id: str = Field(..., alias="_id", description="User's unique identifier")
+    id: PyObjectId = Field(..., alias="_id", description="User's unique identifier")
     created_at: datetime = Field(..., description="User creation timestamp")
     updated_at: datetime = Field(..., description="User last update timestamp")
     
-    model_config = ConfigDict(
-        populate_by_name=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat()
-        }
-    )
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class PaginationInfo(BaseModel):
@@ -60,7 +61,7 @@ class HealthResponse(BaseModel):
     """Health check response model."""
     status: str = Field(..., description="Service status")
     database: str = Field(..., description="Database connection status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Health check timestamp")
 
 
 class ErrorResponse(BaseModel):
@@ -2,21 +2,50 @@
 Routers for the FastAPI application
 """
 
-from typing import List
+from typing import Annotated, List
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from bson import ObjectId
+from pydantic import TypeAdapter
 
 from .models import (
     User, UserCreate, UserUpdate, UserListResponse, 
     PaginationInfo, HealthResponse, SuccessResponse, ErrorResponse
 )
 from .services import get_user_service, get_system_service, UserService, SystemService
-from .config import settings
+from .config import get_settings
 
 # Create routers
 user_router = APIRouter(prefix="/api/users", tags=["users"])
 system_router = APIRouter(tags=["system"])
 
+# Validates a whole page of user documents in a single call
+_USERS_ADAPTER = TypeAdapter(List[User])
+
+# Shared instances for the common error paths; the traceback is reset on
+# each raise so it does not keep growing across requests
+_USER_NOT_FOUND = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="User not found"
+)
+_EMAIL_CONFLICT = HTTPException(
+    status_code=status.HTTP_409_CONFLICT,
+    detail="User with this email already exists"
+)
+_INVALID_USER_ID = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Invalid user ID"
+)
+
+
+async def valid_object_id(user_id: str) -> ObjectId:
+    """Validate the user_id path parameter and convert it once to an ObjectId."""
+    if not ObjectId.is_valid(user_id):
+        raise _INVALID_USER_ID.with_traceback(None)
+    return ObjectId(user_id)
+
 
 @user_router.post(
     "/",
@@ -50,12 +79,8 @@ async def create_user(
         HTTPException: If user with this email already exists
     """
     # Check if user already exists
-    existing_user = await user_service.get_user_by_email(user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User with this email already exists"
-        )
+    if await user_service.email_exists(user_data.email):
+        raise _EMAIL_CONFLICT.with_traceback(None)
     
     return await user_service.create_user(user_data)
 
@@ -89,8 +114,8 @@ async def list_users(
         UserListResponse: List of users with pagination information
     """
     skip = (page - 1) * limit
-    users = await user_service.list_users(skip=skip, limit=limit)
-    total = await user_service.count_users()
+    docs, total = await user_service.list_users_with_total(skip=skip, limit=limit)
+    users = _USERS_ADAPTER.validate_python(docs)
     
     pagination = PaginationInfo(
         page=page,
@@ -102,6 +127,47 @@ async def list_users(
     return UserListResponse(users=users, pagination=pagination)
 
 
+@user_router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    name="Stream Users",
+    responses={
+        200: {
+            "description": "Users streamed as newline-delimited JSON",
+            "content": {"application/x-ndjson": {}}
+        },
+        422: {"description": "Validation error"}
+    }
+)
+async def stream_users(
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    user_service: UserService = Depends(get_user_service)
+) -> StreamingResponse:
+    """
+    Stream users as NDJSON.
+    
+    This endpoint writes one user document per line while reading the
+    database cursor lazily, so the page is never held in memory at once.
+    
+    Args:
+        page: Page number (starts from 1)
+        limit: Number of items per page (max 100)
+        user_service: Injected user service for retrieving users
+        
+    Returns:
+        StreamingResponse: Newline-delimited JSON user documents
+    """
+    skip = (page - 1) * limit
+    
+    async def generate():
+        async for user in user_service.iter_users(skip=skip, limit=limit):
+            yield orjson.dumps(user, default=str) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @user_router.get(
     "/{user_id}",
     response_model=User,
@@ -109,12 +175,13 @@ async def list_users(
     name="Get User",
     responses={
         200: {"description": "User retrieved successfully"},
+        400: {"description": "Invalid user ID"},
         404: {"description": "User not found"},
         422: {"description": "Validation error"}
     }
 )
 async def get_user(
-    user_id: str,
+    user_id: Annotated[ObjectId, Depends(valid_object_id)],
     user_service: UserService = Depends(get_user_service)
 ) -> User:
     """
@@ -136,10 +203,7 @@ async def get_user(
     user = await user_service.get_user_by_id(user_id)
     
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+        raise _USER_NOT_FOUND.with_traceback(None)
     
     return user
 
@@ -151,12 +215,13 @@ async def get_user(
     name="Update User",
     responses={
         200: {"description": "User updated successfully"},
+        400: {"description": "Invalid user ID"},
         404: {"description": "User not found"},
         422: {"description": "Validation error"}
     }
 )
 async def update_user(
-    user_id: str,
+    user_id: Annotated[ObjectId, Depends(valid_object_id)],
     user_data: UserUpdate,
     user_service: UserService = Depends(get_user_service)
 ) -> User:
@@ -177,20 +242,10 @@ async def update_user(
     Raises:
         HTTPException: If user is not found
     """
-    # Check if user exists
-    existing_user = await user_service.get_user_by_id(user_id)
-    if not existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
+    # No document returned means the user did not exist
     updated_user = await user_service.update_user(user_id, user_data)
     if not updated_user:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update user"
-        )
+        raise _USER_NOT_FOUND.with_traceback(None)
     
     return updated_user
 
@@ -202,11 +257,12 @@ async def update_user(
     name="Delete User",
     responses={
         200: {"description": "User deleted successfully"},
+        400: {"description": "Invalid user ID"},
         404: {"description": "User not found"}
     }
 )
 async def delete_user(
-    user_id: str,
+    user_id: Annotated[ObjectId, Depends(valid_object_id)],
     user_service: UserService = Depends(get_user_service)
 ) -> SuccessResponse:
     """
@@ -224,20 +280,9 @@ async def delete_user(
     Raises:
         HTTPException: If user is not found
     """
-    # Check if user exists
-    existing_user = await user_service.get_user_by_id(user_id)
-    if not existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    success = await user_service.delete_user(user_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete user"
-        )
+    # Nothing deleted means the user did not exist
+    if not await user_service.delete_user(user_id):
+        raise _USER_NOT_FOUND.with_traceback(None)
     
     return SuccessResponse(message="User deleted successfully")
 
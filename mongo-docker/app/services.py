@@ -2,96 +2,129 @@
 Services for the FastAPI application
 """
 
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Annotated
+import asyncio
+from typing import List, Optional, Dict, Any, Annotated, AsyncIterator, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from pymongo import ReturnDocument, WriteConcern
 from fastapi import Depends
 import logging
 
 from .models import UserCreate, UserUpdate, User, PaginationInfo
 from .database import get_database
+from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Only the fields the User model reads; anything else stays on the server
+_USER_PROJECTION = {field.alias or name: 1 for name, field in User.model_fields.items()}
+
 class UserService:
     """Service for user operations."""
     
     def __init__(self, db: AsyncIOMotorDatabase):
         self.db = db
         self.collection = db.users
+        # Creates and deletes only need primary acknowledgement, not replication to a majority
+        self.w1_collection = self.collection.with_options(write_concern=WriteConcern(w=1))
+        # Skipping the $jsonSchema validator from init-mongo.js is opt-in, see Settings
+        self.bypass_validation = get_settings().mongodb_bypass_document_validation
     
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user."""
         user_dict = user_data.model_dump()
-        user_dict.update({
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
-        })
-        
-        result = await self.collection.insert_one(user_dict)
-        user_dict["_id"] = str(result.inserted_id)
         
-        print(f"User created: {user_dict['_id']}, email: {user_dict['email']}")
-        return User(**user_dict)
+        # Insert via upsert so the server stamps both timestamps with $currentDate
+        # and returns the stored document in the same round-trip
+        user = await self.w1_collection.find_one_and_update(
+            {"_id": ObjectId()},
+            {
+                "$setOnInsert": user_dict,
+                "$currentDate": {"created_at": True, "updated_at": True}
+            },
+            upsert=True,
+            projection=_USER_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+            # Input was already validated by the UserCreate model
+            bypassDocumentValidation=self.bypass_validation
+        )
+        logger.debug("User created: %s, email: %s", user["_id"], user["email"])
+        return User.model_validate(user)
     
-    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def get_user_by_id(self, user_id: ObjectId) -> Optional[User]:
         """Get user by ID."""
-        try:
-            user = await self.collection.find_one({"_id": ObjectId(user_id)})
-            if user:
-                user["_id"] = str(user["_id"])
-                return User(**user)
-            return None
-        except Exception:
-            return None
-    
-    async def get_user_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
-        user = await self.collection.find_one({"email": email})
+        user = await self.collection.find_one({"_id": user_id}, projection=_USER_PROJECTION)
         if user:
-            user["_id"] = str(user["_id"])
-            return User(**user)
+            return User.model_validate(user)
         return None
     
-    async def update_user(self, user_id: str, update_data: UserUpdate) -> Optional[User]:
+    async def email_exists(self, email: str) -> bool:
+        """Check whether a user with this email exists."""
+        # Projection is covered by the unique email index, no document fetch needed
+        user = await self.collection.find_one({"email": email}, projection={"_id": 0, "email": 1})
+        return user is not None
+    
+    async def update_user(self, user_id: ObjectId, update_data: UserUpdate) -> Optional[User]:
         """Update user."""
         update_dict = update_data.model_dump(exclude_unset=True)
         if not update_dict:
-            return await self.get_user_by_id(user_id)
-        
-        update_dict["updated_at"] = datetime.utcnow()
-        
-        result = await self.collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": update_dict}
-        )
+            user = await self.collection.find_one({"_id": user_id}, projection=_USER_PROJECTION)
+        else:
+            user = await self.collection.find_one_and_update(
+                {"_id": user_id},
+                {"$set": update_dict, "$currentDate": {"updated_at": True}},
+                projection=_USER_PROJECTION,
+                return_document=ReturnDocument.AFTER
+            )
+            if user:
+                logger.debug("User updated: %s", user_id)
         
-        if result.modified_count:
-            print(f"User updated: {user_id}")
-            return await self.get_user_by_id(user_id)
+        if user:
+            return User.model_validate(user)
         return None
     
-    async def delete_user(self, user_id: str) -> bool:
+    async def delete_user(self, user_id: ObjectId) -> bool:
         """Delete user."""
-        result = await self.collection.delete_one({"_id": ObjectId(user_id)})
-        if result.deleted_count:
-            print(f"User deleted: {user_id}")
-            return True
-        return False
+        return bool((await self.w1_collection.delete_one({"_id": user_id})).deleted_count)
     
-    async def list_users(self, skip: int = 0, limit: int = 10) -> List[User]:
-        """List users with pagination."""
-        cursor = self.collection.find().skip(skip).limit(limit)
-        users = []
+    async def list_users_raw(self, skip: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
+        """List raw user documents with pagination."""
+        # Fetch the whole page in a single batch instead of iterating per document;
+        # newest first, walking the created_at index
+        cursor = (
+            self.collection.find({}, projection=_USER_PROJECTION, batch_size=limit)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        return await cursor.to_list(length=limit)
+    
+    async def iter_users(self, skip: int = 0, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate raw user documents with pagination without buffering the page."""
+        # Same order as list_users_raw so stream and list pages line up
+        cursor = (
+            self.collection.find({}, projection=_USER_PROJECTION)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
         async for user in cursor:
-            user["_id"] = str(user["_id"])
-            users.append(User(**user))
-        return users
+            yield user
+    
+    async def list_users_with_total(self, skip: int = 0, limit: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+        """List raw user documents and the total user count concurrently."""
+        # A $facet pipeline would do this in one round-trip, but its sub-pipelines
+        # cannot use indexes, so the page query and the count run side by side
+        users, total = await asyncio.gather(
+            self.list_users_raw(skip=skip, limit=limit),
+            self.count_users()
+        )
+        return users, total
     
     async def count_users(self) -> int:
         """Count total users."""
-        return await self.collection.count_documents({})
+        # Reads collection metadata instead of scanning documents
+        return await self.collection.estimated_document_count()
 
 
 class SystemService:
@@ -109,19 +142,31 @@ class SystemService:
                 "database": "connected"
             }
         except Exception as e:
-            logger.error("Health check failed", error=str(e))
+            logger.error("Health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "database": "disconnected"
             }
 
 
+# Service singletons, rebuilt only if the database handle changes (reconnect)
+_service_cache: Dict[str, Any] = {}
+
+
 # Dependency functions
+# These stay async: FastAPI runs sync dependencies in its threadpool, while
+# async ones that never await are stepped inline on the event loop.
 async def get_user_service(db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]) -> UserService:
-    """Get user service instance."""
-    return UserService(db)
+    """Get the shared user service instance."""
+    service = _service_cache.get("users")
+    if service is None or service.db is not db:
+        service = _service_cache["users"] = UserService(db)
+    return service
 
 
 async def get_system_service(db: Annotated[AsyncIOMotorDatabase, Depends(get_database)]) -> SystemService:
-    """Get system service instance."""
-    return SystemService(db)
+    """Get the shared system service instance."""
+    service = _service_cache.get("system")
+    if service is None or service.db is not db:
+        service = _service_cache["system"] = SystemService(db)
+    return service
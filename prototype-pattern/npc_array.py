@@ -0,0 +1,105 @@
+"""
+Batched NPC Simulation - Structure of Arrays
+
+Large battles spend most of their time dispatching Python methods on individual
+NPC objects. NPCArray keeps the same state as parallel NumPy columns instead, so
+a whole group attacks, regenerates or rages in a single vectorized operation.
+Columns are initialized from the prototypes in npc_prototype.py.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from npc_prototype import NPC, NPCPrototypeManager
+
+
+class NPCArray:
+    """Column-oriented storage for a batch of NPCs spawned from prototypes"""
+
+    def __init__(self, groups: Sequence[Tuple[NPC, int]]):
+        prototypes = [prototype for prototype, _ in groups]
+        counts = [count for _, count in groups]
+
+        def column(values: List, dtype) -> np.ndarray:
+            # One value per prototype, repeated for every NPC spawned from it
+            return np.repeat(np.array(values, dtype=dtype), counts)
+
+        self.health = column([p.health for p in prototypes], np.int32)
+        self.attack_power = column([p.attack_power for p in prototypes], np.int32)
+        self.speed = column([p.speed for p in prototypes], np.int32)
+        self.is_alive = column([p.is_alive for p in prototypes], np.bool_)
+        self.regeneration = column([getattr(p, "regeneration", 0) for p in prototypes], np.int32)
+        self.rage_damage_bonus = column([getattr(p, "rage_damage_bonus", 0) for p in prototypes], np.int32)
+
+        # Index array of each spawned group, in the order given
+        offsets = np.cumsum([0] + counts)
+        self.groups = [np.arange(start, end) for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def __len__(self) -> int:
+        return len(self.health)
+
+    def attack_group(self, src_idx: np.ndarray, dst_idx: np.ndarray) -> None:
+        """Each attacker in src_idx hits the target at the same position in dst_idx"""
+        if len(src_idx) != len(dst_idx):
+            raise ValueError(f"Got {len(src_idx)} attackers for {len(dst_idx)} targets")
+        # Attacks in one call resolve simultaneously, unlike sequential NPC.attack calls
+        active = self.is_alive[src_idx] & self.is_alive[dst_idx]
+        np.subtract.at(self.health, dst_idx[active], self.attack_power[src_idx[active]])
+        np.maximum(self.health, 0, out=self.health)
+        self.is_alive &= self.health > 0
+
+    def regenerate(self, idx: np.ndarray) -> None:
+        """Living NPCs in idx regain their regeneration amount"""
+        alive = idx[self.is_alive[idx]]
+        self.health[alive] += self.regeneration[alive]
+
+    def enter_berserker_rage(self, idx: np.ndarray) -> None:
+        """NPCs in idx add their rage bonus to their attack power"""
+        self.attack_power[idx] += self.rage_damage_bonus[idx]
+
+    def survivors(self) -> int:
+        """Number of NPCs still alive"""
+        return int(np.count_nonzero(self.is_alive))
+
+
+def _attack_spread(npcs: NPCArray, src_idx: np.ndarray, dst_idx: np.ndarray) -> None:
+    """Attackers in src_idx spread over dst_idx, cycling targets to match group sizes"""
+    if len(src_idx) and len(dst_idx):
+        npcs.attack_group(src_idx, np.resize(dst_idx, len(src_idx)))
+
+
+def simulate_batched_battle(zombies: int = 3000, goblins: int = 2000, orcs: int = 1000, rounds: int = 3) -> None:
+    """Run the NPC battle scenario on NPCArray columns"""
+
+    print("=== Batched Battle: Structure of Arrays ===\n")
+
+    npc_manager = NPCPrototypeManager()
+    npcs = NPCArray([
+        (npc_manager.prototypes["zombie"], zombies),
+        (npc_manager.prototypes["goblin"], goblins),
+        (npc_manager.prototypes["orc"], orcs),
+    ])
+    zombie_idx, goblin_idx, orc_idx = npcs.groups
+    print(f"Spawned {len(npcs)} NPCs: {zombies} zombies, {goblins} goblins, {orcs} orcs\n")
+
+    # Orcs enter berserker rage once before the fighting starts
+    npcs.enter_berserker_rage(orc_idx)
+
+    for _ in range(rounds):
+        # Zombies attack goblins
+        _attack_spread(npcs, zombie_idx, goblin_idx)
+        npcs.regenerate(zombie_idx)
+
+        # Goblins and orcs strike back, orcs starting from the last zombie
+        _attack_spread(npcs, goblin_idx, zombie_idx)
+        _attack_spread(npcs, orc_idx, zombie_idx[::-1])
+
+    print("=== Battle Results ===")
+    for name, idx in zip(("Zombies", "Goblins", "Orcs"), npcs.groups):
+        print(f"{name}: {int(np.count_nonzero(npcs.is_alive[idx]))}/{len(idx)} alive")
+    print(f"\nSurvivors: {npcs.survivors()}/{len(npcs)}")
+
+
+if __name__ == "__main__":
+    simulate_batched_battle()
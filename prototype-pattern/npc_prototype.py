@@ -6,14 +6,28 @@ dependent on their classes. It's particularly useful when object creation is exp
 and you need multiple similar instances.
 """
 
-import copy
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+import logging
+import sys
+from abc import ABC
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+
+# Per-action combat messages are logged at DEBUG level
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Collect the slot names declared across a class hierarchy"""
+    return tuple(slot for klass in cls.__mro__ for slot in getattr(klass, "__slots__", ()))
 
 
 class NPC(ABC):
     """Abstract prototype class for Non-Player Characters"""
     
+    __slots__ = ("name", "health", "attack_power", "speed", "position", "is_alive", "_class_name", "_status")
+    
     def __init__(self, name: str, health: int, attack_power: int, speed: int):
         self.name = name
         self.health = health
@@ -21,18 +35,28 @@ class NPC(ABC):
         self.speed = speed
         self.position = (0, 0)
         self.is_alive = True
+        self._class_name = sys.intern(type(self).__name__)
+        self._status = "Alive"
     
-    @abstractmethod
     def clone(self) -> 'NPC':
         """Create a copy of this NPC"""
-        pass
+        # All fields are immutable, so a shallow slot-by-slot copy is enough
+        cloned_npc = object.__new__(type(self))
+        for slot in _slot_names(type(self)):
+            setattr(cloned_npc, slot, getattr(self, slot))
+        # Subclasses that don't declare __slots__ still carry a __dict__
+        if hasattr(self, "__dict__"):
+            cloned_npc.__dict__.update(self.__dict__)
+        # Give the clone a unique name
+        cloned_npc.name = f"{self.name}_Clone_{id(cloned_npc)}"
+        return cloned_npc
     
     def attack(self, target: 'NPC') -> None:
         """Attack another NPC"""
         if self.is_alive and target.is_alive:
             damage = self.attack_power
             target.take_damage(damage)
-            print(f"{self.name} attacks {target.name} for {damage} damage!")
+            logger.debug("%s attacks %s for %s damage!", self.name, target.name, damage)
     
     def take_damage(self, damage: int) -> None:
         """Take damage and check if NPC dies"""
@@ -40,85 +64,70 @@ class NPC(ABC):
         if self.health <= 0:
             self.health = 0
             self.is_alive = False
-            print(f"{self.name} has been defeated!")
+            self._status = "Dead"
+            logger.debug("%s has been defeated!", self.name)
         else:
-            print(f"{self.name} takes {damage} damage. Health: {self.health}")
+            logger.debug("%s takes %s damage. Health: %s", self.name, damage, self.health)
     
     def move(self, x: int, y: int) -> None:
         """Move NPC to new position"""
         self.position = (x, y)
-        print(f"{self.name} moves to position ({x}, {y})")
+        logger.debug("%s moves to position (%s, %s)", self.name, x, y)
     
     def __str__(self) -> str:
-        status = "Alive" if self.is_alive else "Dead"
-        return f"{self.__class__.__name__}: {self.name} - Health: {self.health}, Attack: {self.attack_power}, Speed: {self.speed}, Status: {status}"
+        return f"{self._class_name}: {self.name} - Health: {self.health}, Attack: {self.attack_power}, Speed: {self.speed}, Status: {self._status}"
 
 
 class Zombie(NPC):
     """Concrete prototype for Zombie NPCs"""
     
+    __slots__ = ("undead", "regeneration")
+    
     def __init__(self, name: str = "Zombie", health: int = 80, attack_power: int = 15, speed: int = 5):
         super().__init__(name, health, attack_power, speed)
         self.undead = True
         self.regeneration = 2
     
-    def clone(self) -> 'Zombie':
-        """Create a deep copy of this Zombie"""
-        cloned_zombie = copy.deepcopy(self)
-        # Give the clone a unique name
-        cloned_zombie.name = f"{self.name}_Clone_{id(cloned_zombie)}"
-        return cloned_zombie
-    
     def regenerate(self) -> None:
         """Zombies slowly regenerate health"""
         if self.is_alive:
             self.health += self.regeneration
-            print(f"{self.name} regenerates {self.regeneration} health. New health: {self.health}")
+            logger.debug("%s regenerates %s health. New health: %s", self.name, self.regeneration, self.health)
 
 
 class Goblin(NPC):
     """Concrete prototype for Goblin NPCs"""
     
+    __slots__ = ("stealth", "critical_chance")
+    
     def __init__(self, name: str = "Goblin", health: int = 50, attack_power: int = 12, speed: int = 8):
         super().__init__(name, health, attack_power, speed)
         self.stealth = True
         self.critical_chance = 0.2
     
-    def clone(self) -> 'Goblin':
-        """Create a deep copy of this Goblin"""
-        cloned_goblin = copy.deepcopy(self)
-        # Give the clone a unique name
-        cloned_goblin.name = f"{self.name}_Clone_{id(cloned_goblin)}"
-        return cloned_goblin
-    
     def sneak_attack(self, target: 'NPC') -> None:
         """Goblins can perform sneak attacks with higher damage"""
         if self.is_alive and target.is_alive:
             damage = int(self.attack_power * 1.5)
             target.take_damage(damage)
-            print(f"{self.name} performs a sneak attack on {target.name} for {damage} damage!")
+            logger.debug("%s performs a sneak attack on %s for %s damage!", self.name, target.name, damage)
 
 
 class Orc(NPC):
     """Concrete prototype for Orc NPCs"""
     
+    __slots__ = ("berserker_rage", "rage_damage_bonus")
+    
     def __init__(self, name: str = "Orc", health: int = 120, attack_power: int = 25, speed: int = 3):
         super().__init__(name, health, attack_power, speed)
         self.berserker_rage = False
         self.rage_damage_bonus = 10
     
-    def clone(self) -> 'Orc':
-        """Create a deep copy of this Orc"""
-        cloned_orc = copy.deepcopy(self)
-        # Give the clone a unique name
-        cloned_orc.name = f"{self.name}_Clone_{id(cloned_orc)}"
-        return cloned_orc
-    
     def enter_berserker_rage(self) -> None:
         """Orcs can enter berserker rage for increased damage"""
         self.berserker_rage = True
         self.attack_power += self.rage_damage_bonus
-        print(f"{self.name} enters berserker rage! Attack power increased to {self.attack_power}")
+        logger.debug("%s enters berserker rage! Attack power increased to %s", self.name, self.attack_power)
 
 
 class NPCPrototypeManager:
@@ -146,7 +155,7 @@ class NPCPrototypeManager:
         
         prototype = self.prototypes[npc_type]
         cloned_npc = prototype.clone()
-        print(f"Created new {npc_type} from prototype: {cloned_npc.name}")
+        logger.debug("Created new %s from prototype: %s", npc_type, cloned_npc.name)
         return cloned_npc
     
     def add_prototype(self, npc_type: str, prototype: NPC) -> None:
@@ -290,4 +299,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     main()
@@ -4,88 +4,146 @@ Only API methods, no HTML, no frontend
 """
 
 from fastapi import FastAPI, HTTPException
+from cachetools import TTLCache
+import asyncio
 import httpx
 import secrets
+from typing import Dict, Literal, TypedDict
+from urllib.parse import urlencode
 
 app = FastAPI(title="Simple Social Auth")
 
-# Simple in-memory storage
+# Simple in-memory storage; sessions and OAuth states expire on their own
 users = {}
-sessions = {}
+sessions = TTLCache(maxsize=100_000, ttl=3600)
+oauth_states = TTLCache(maxsize=10_000, ttl=300)
+
+# Shared HTTP client, reuses connections to the providers across requests
+http_client: httpx.AsyncClient | None = None
+
+# Supported providers; FastAPI rejects anything else with a 422 before the handler runs
+Provider = Literal["google", "github"]
+
+
+class _ProviderConfigBase(TypedDict):
+    client_id: str
+    client_secret: str
+    auth_base: str
+    extra_params: Dict[str, str]
+    token_url: str
+    user_info_url: str
+
+
+class ProviderConfig(_ProviderConfigBase, total=False):
+    """OAuth2 settings for a single provider"""
+    emails_url: str
+
 
 # OAuth2 configs (replace with your real credentials)
-CONFIGS = {
+CONFIGS: Dict[Provider, ProviderConfig] = {
     "google": {
         "client_id": "your-google-client-id",
         "client_secret": "your-google-client-secret",
+        "auth_base": "https://accounts.google.com/o/oauth2/auth",
+        "extra_params": {"scope": "openid email profile", "response_type": "code"},
         "token_url": "https://oauth2.googleapis.com/token",
         "user_info_url": "https://www.googleapis.com/oauth2/v2/userinfo"
     },
     "github": {
         "client_id": "your-github-client-id",
         "client_secret": "your-github-client-secret",
+        "auth_base": "https://github.com/login/oauth/authorize",
+        "extra_params": {"scope": "user:email"},
         "token_url": "https://github.com/login/oauth/access_token",
-        "user_info_url": "https://api.github.com/user"
+        "user_info_url": "https://api.github.com/user",
+        "emails_url": "https://api.github.com/user/emails"
     }
 }
 
 
+@app.on_event("startup")
+async def startup():
+    """Create the shared HTTP client"""
+    global http_client
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the shared HTTP client"""
+    await http_client.aclose()
+
+
 @app.get("/auth/{provider}/url")
-async def get_auth_url(provider: str):
+async def get_auth_url(provider: Provider):
     """Get authorization URL for the provider"""
-    if provider not in CONFIGS:
-        raise HTTPException(status_code=404, detail="Provider not supported")
-
     config = CONFIGS[provider]
     state = secrets.token_urlsafe(16)
-    sessions[state] = provider
+    oauth_states[state] = provider
 
-    if provider == "google":
-        auth_url = f"https://accounts.google.com/o/oauth2/auth?client_id={config['client_id']}&redirect_uri=http://localhost:8000/auth/{provider}/callback&scope=openid email profile&response_type=code&state={state}"
-    elif provider == "github":
-        auth_url = f"https://github.com/login/oauth/authorize?client_id={config['client_id']}&redirect_uri=http://localhost:8000/auth/{provider}/callback&scope=user:email&state={state}"
+    params = {
+        "client_id": config["client_id"],
+        "redirect_uri": f"http://localhost:8000/auth/{provider}/callback",
+        "state": state,
+        **config["extra_params"]
+    }
+    auth_url = f"{config['auth_base']}?{urlencode(params)}"
 
     return {"auth_url": auth_url, "state": state}
 
 
 @app.post("/auth/{provider}/callback")
-async def handle_callback(provider: str, code: str, state: str):
+async def handle_callback(provider: Provider, code: str, state: str):
     """Handle OAuth2 callback and return access token"""
-    if provider not in CONFIGS:
-        raise HTTPException(status_code=404, detail="Provider not supported")
-
-    if state not in sessions:
+    if state not in oauth_states:
         raise HTTPException(status_code=400, detail="Invalid state")
 
     config = CONFIGS[provider]
 
+    # Create session token up front, it does not depend on the provider
+    session_token = secrets.token_urlsafe(32)
+
     # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_data = {
-            "client_id": config["client_id"],
-            "client_secret": config["client_secret"],
-            "code": code
-        }
+    token_data = {
+        "client_id": config["client_id"],
+        "client_secret": config["client_secret"],
+        "code": code
+    }
 
-        response = await client.post(config["token_url"], data=token_data)
-        token_response = response.json()
-        access_token = token_response.get("access_token")
+    response = await http_client.post(config["token_url"], data=token_data)
+    token_response = response.json()
+    access_token = token_response.get("access_token")
 
-        if not access_token:
-            raise HTTPException(status_code=400, detail="Failed to get access token")
+    if not access_token:
+        raise HTTPException(status_code=400, detail="Failed to get access token")
 
     # Get user info
-    async with httpx.AsyncClient() as client:
-        if provider == "google":
-            headers = {"Authorization": f"Bearer {access_token}"}
-        else:  # github
-            headers = {"Authorization": f"token {access_token}"}
+    if provider == "google":
+        headers = {"Authorization": f"Bearer {access_token}"}
+    else:  # github
+        headers = {"Authorization": f"token {access_token}"}
 
-        response = await client.get(config["user_info_url"], headers=headers)
-        user_info = response.json()
+    # Fetch user info and, when the provider has one, the email list concurrently
+    requests = [http_client.get(config["user_info_url"], headers=headers)]
+    if "emails_url" in config:
+        requests.append(http_client.get(config["emails_url"], headers=headers))
+    responses = await asyncio.gather(*requests)
+    user_info = responses[0].json()
 
     # Create or get user
     email = user_info.get("email")
+    if not email and len(responses) > 1 and responses[1].is_success:
+        # GitHub hides private emails from /user, take the primary one instead
+        emails = responses[1].json()
+        if isinstance(emails, list):
+            email = next(
+                (item["email"] for item in emails if item.get("primary") and item.get("verified")),
+                None
+            )
     if not email:
         raise HTTPException(status_code=400, detail="Email not provided")
 
@@ -98,12 +156,10 @@ async def handle_callback(provider: str, code: str, state: str):
             "provider": provider
         }
 
-    # Create session token
-    session_token = secrets.token_urlsafe(32)
     sessions[session_token] = user_id
 
     # Clean up state
-    del sessions[state]
+    oauth_states.pop(state, None)
 
     return {
         "access_token": session_token,
@@ -114,14 +170,14 @@ async def handle_callback(provider: str, code: str, state: str):
 @app.get("/me")
 async def get_current_user(Authorization: str = None):
     """Get current user info"""
-    if not Authorization or not Authorization.startswith("Bearer "):
+    token = Authorization.removeprefix("Bearer ") if Authorization else None
+    if token is None or token == Authorization:
         raise HTTPException(status_code=401, detail="No token provided")
 
-    token = Authorization.split(" ")[1]
-    if token not in sessions:
+    user_id = sessions.get(token)
+    if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user_id = sessions[token]
     if user_id not in users:
         raise HTTPException(status_code=401, detail="User not found")
 
@@ -131,12 +187,11 @@ async def get_current_user(Authorization: str = None):
 @app.post("/logout")
 async def logout(Authorization: str = None):
     """Logout user"""
-    if not Authorization or not Authorization.startswith("Bearer "):
+    token = Authorization.removeprefix("Bearer ") if Authorization else None
+    if token is None or token == Authorization:
         raise HTTPException(status_code=401, detail="No token provided")
 
-    token = Authorization.split(" ")[1]
-    if token in sessions:
-        del sessions[token]
+    sessions.pop(token, None)
 
     return {"message": "Logged out"}
 
@@ -2,100 +2,125 @@
 State Pattern Example - Digital Media Player
 
 The State pattern allows an object to alter its behavior when its internal state changes.
-Instead of using long if-else statements, each state handles its own behavior.
+Instead of using long if-else statements, each (state, action) pair is looked up
+in a transition table, and the State classes are thin views over that table.
 """
 
-from abc import ABC, abstractmethod
+import logging
+import sys
+from enum import IntEnum
 
 
-class State(ABC):
-    """Abstract state interface"""
+logger = logging.getLogger(__name__)
+
+
+class PlayerState(IntEnum):
+    """Identifiers of the media player states"""
+    STOPPED = 0
+    PLAYING = 1
+    PAUSED = 2
+
+
+# (state, action) -> (next state or None to stay, message)
+TRANSITIONS = {
+    (PlayerState.STOPPED, "play"): (PlayerState.PLAYING, "Starting playback..."),
+    (PlayerState.STOPPED, "pause"): (None, "Cannot pause - not playing!"),
+    (PlayerState.STOPPED, "stop"): (None, "Already stopped!"),
+    (PlayerState.PLAYING, "play"): (None, "Already playing!"),
+    (PlayerState.PLAYING, "pause"): (PlayerState.PAUSED, "Pausing..."),
+    (PlayerState.PLAYING, "stop"): (PlayerState.STOPPED, "Stopping..."),
+    (PlayerState.PAUSED, "play"): (PlayerState.PLAYING, "Resuming..."),
+    (PlayerState.PAUSED, "pause"): (None, "Already paused!"),
+    (PlayerState.PAUSED, "stop"): (PlayerState.STOPPED, "Stopping..."),
+}
+
+
+def _transition(player, state_id, action):
+    """Apply an action to the player as seen from the given state"""
+    next_state, message = TRANSITIONS[(state_id, action)]
+    logger.debug(message)
+    if next_state is not None:
+        player.set_state(STATES[next_state])
+
+
+class State:
+    """State interface; actions are resolved through the TRANSITIONS table"""
+    
+    state_id: PlayerState
     
-    @abstractmethod
     def play(self, player):
-        pass
+        _transition(player, self.state_id, "play")
     
-    @abstractmethod
     def pause(self, player):
-        pass
+        _transition(player, self.state_id, "pause")
     
-    @abstractmethod
     def stop(self, player):
-        pass
+        _transition(player, self.state_id, "stop")
 
 
 class PlayingState(State):
     """State when media is playing"""
     
-    def play(self, player):
-        print("Already playing!")
-    
-    def pause(self, player):
-        print("Pausing...")
-        player.set_state(PausedState())
-    
-    def stop(self, player):
-        print("Stopping...")
-        player.set_state(StoppedState())
+    state_id = PlayerState.PLAYING
 
 
 class PausedState(State):
     """State when media is paused"""
     
-    def play(self, player):
-        print("Resuming...")
-        player.set_state(PlayingState())
-    
-    def pause(self, player):
-        print("Already paused!")
-    
-    def stop(self, player):
-        print("Stopping...")
-        player.set_state(StoppedState())
+    state_id = PlayerState.PAUSED
 
 
 class StoppedState(State):
     """State when media is stopped"""
     
-    def play(self, player):
-        print("Starting playback...")
-        player.set_state(PlayingState())
-    
-    def pause(self, player):
-        print("Cannot pause - not playing!")
-    
-    def stop(self, player):
-        print("Already stopped!")
+    state_id = PlayerState.STOPPED
+
+
+# States hold no data, so a single shared instance of each is reused
+PLAYING = PlayingState()
+PAUSED = PausedState()
+STOPPED = StoppedState()
+
+STATES = {
+    PlayerState.PLAYING: PLAYING,
+    PlayerState.PAUSED: PAUSED,
+    PlayerState.STOPPED: STOPPED,
+}
 
 
 class MediaPlayer:
     """Media player that changes behavior based on state"""
     
     def __init__(self):
-        self.current_state = StoppedState()
+        self.state = PlayerState.STOPPED
         self.current_track = "Unknown Track"
     
+    @property
+    def current_state(self):
+        """The State object for the current state"""
+        return STATES[self.state]
+    
     def set_state(self, new_state):
         """Change the current state"""
-        self.current_state = new_state
-        print(f"State changed to: {new_state.__class__.__name__}")
+        self.state = new_state.state_id
+        logger.debug("State changed to: %s", new_state.__class__.__name__)
     
     def play(self):
-        """Delegate play action to current state"""
-        self.current_state.play(self)
+        """Look up the play transition for the current state"""
+        _transition(self, self.state, "play")
     
     def pause(self):
-        """Delegate pause action to current state"""
-        self.current_state.pause(self)
+        """Look up the pause transition for the current state"""
+        _transition(self, self.state, "pause")
     
     def stop(self):
-        """Delegate stop action to current state"""
-        self.current_state.stop(self)
+        """Look up the stop transition for the current state"""
+        _transition(self, self.state, "stop")
     
     def set_track(self, track_name):
         """Set the current track"""
         self.current_track = track_name
-        print(f"Track set to: {track_name}")
+        logger.debug("Track set to: %s", track_name)
 
 
 def main():
@@ -143,4 +168,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
     main()